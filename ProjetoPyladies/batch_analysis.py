@@ -0,0 +1,53 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from dna_sequence import DNASequence, RestrictionScanner
+
+
+def _analyze_one(dna: DNASequence, min_orf_length: int,
+                 scanner: RestrictionScanner) -> Dict[str, Any]:
+    """Executa as análises de uma única sequência (roda no processo trabalhador)."""
+    return {
+        'id': dna.id,
+        'gc_content': dna.gc_content(),
+        'orfs': dna.find_orfs(min_orf_length),
+        'restriction_sites': scanner.scan(dna),
+    }
+
+
+def analyze_sequences(sequences: List[DNASequence], min_orf_length: int = 100,
+                      enzymes: Optional[List[str]] = None,
+                      max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Calcula GC%, ORFs e sítios de restrição de várias sequências em paralelo.
+
+    Cada sequência é independente, então o trabalho é distribuído entre
+    processos (contornando o GIL). Retorna um dicionário por sequência, na
+    mesma ordem da entrada. Com max_workers=1 a análise roda no processo atual.
+    """
+    # O painel de enzimas é preparado uma única vez e reaproveitado em todas as sequências
+    scanner = RestrictionScanner(enzymes)
+    analyze = partial(_analyze_one, min_orf_length=min_orf_length, scanner=scanner)
+    
+    if max_workers == 1 or len(sequences) < 2:
+        return [analyze(dna) for dna in sequences]
+    
+    workers = max_workers or os.cpu_count() or 1
+    # Lotes maiores diluem o custo de comunicação entre processos
+    chunksize = max(1, len(sequences) // (4 * workers))
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(analyze, sequences, chunksize=chunksize))
+
+
+if __name__ == "__main__":
+    from fasta_handler import FastaHandler
+    
+    print("Para testar este bloco, crie um arquivo 'sequences.fasta' no diretório.")
+    
+    # Exemplo: Analisar todas as sequências de um arquivo
+    # sequences = FastaHandler.read("sequences.fasta", DNASequence)
+    # for result in analyze_sequences(sequences, min_orf_length=90):
+    #     print(f"{result['id']}: GC% = {result['gc_content']:.2f}%, ORFs = {len(result['orfs'])}")
@@ -1,3 +1,4 @@
+import bisect
 from typing import Optional, List, Dict, Tuple
 
 # --- Exceções e Validação ---
@@ -7,17 +8,125 @@ class InvalidSequenceError(Exception):
     pass
 
 
+def _build_normalize_table(bases) -> bytes:
+    """
+    Monta a tabela de translate que, numa única passada, leva as bases para
+    maiúsculas e marca qualquer outro byte com 0x00.
+    """
+    table = bytearray(256)
+    for base in bases:
+        table[ord(base)] = table[ord(base.lower())] = ord(base)
+    return bytes(table)
+
+
 class DNAValidator:
     """Utilitário estático para validar bases de DNA."""
     _VALID_BASES = {'A', 'T', 'G', 'C', 'N'}
+    _NORMALIZE_TABLE = _build_normalize_table(_VALID_BASES)
     
     @staticmethod
     def is_valid(sequence: str) -> bool:
         """Verifica se a sequência é não-vazia e contém apenas bases válidas."""
-        if not sequence:
+        try:
+            data = sequence.encode('ascii')
+        except UnicodeEncodeError:
             return False
-        # Uso de set.issubset para verificação eficiente
-        return set(sequence.upper()) <= DNAValidator._VALID_BASES
+        return DNAValidator.normalize_bytes(data) is not None
+    
+    @staticmethod
+    def normalize_bytes(data: bytes) -> Optional[bytes]:
+        """
+        Padroniza e valida a sequência ao mesmo tempo.
+        Retorna os bytes em maiúsculas, ou None se a sequência for inválida.
+        """
+        normalized = data.translate(DNAValidator._NORMALIZE_TABLE)
+        if not normalized or 0 in normalized:
+            return None
+        return normalized
+
+
+# --- Núcleos de busca sobre o buffer de bytes ---
+
+_START_CODON = b'ATG'
+_STOP_CODONS = (b'TAA', b'TAG', b'TGA')
+
+
+def _find_positions(data: bytes, target: bytes, step: int = 1) -> List[int]:
+    """Retorna as posições de target em data, avançando step após cada achado."""
+    positions = []
+    position = data.find(target)
+    while position != -1:
+        positions.append(position)
+        position = data.find(target, position + step)
+    return positions
+
+
+def _find_orf_bounds(data: bytes, min_length: int) -> List[Tuple[int, int]]:
+    """
+    Retorna os limites (início, fim exclusivo) dos ORFs forward em data.
+
+    Em vez de percorrer códon a códon, localiza starts e stops com buscas em C
+    e os agrupa por quadro de leitura (posição % 3); cada start é pareado com
+    o próximo stop do mesmo quadro via bisect. Opera apenas sobre bytes, sem
+    depender de DNASequence.
+    """
+    starts_by_frame: List[List[int]] = [[], [], []]
+    for position in _find_positions(data, _START_CODON):
+        starts_by_frame[position % 3].append(position)
+    
+    stops_by_frame: List[List[int]] = [[], [], []]
+    for stop_codon in _STOP_CODONS:
+        for position in _find_positions(data, stop_codon):
+            stops_by_frame[position % 3].append(position)
+    
+    bounds = []
+    for frame_starts, frame_stops in zip(starts_by_frame, stops_by_frame):
+        frame_stops.sort()
+        next_free = 0
+        
+        for start_pos in frame_starts:
+            # Starts dentro de um ORF já encontrado são ignorados
+            if start_pos < next_free:
+                continue
+            
+            k = bisect.bisect_left(frame_stops, start_pos + 3)
+            if k == len(frame_stops):
+                # Sem stop adiante neste quadro: nenhum ORF restante
+                break
+            
+            end_pos_exclusive = frame_stops[k] + 3
+            if end_pos_exclusive - start_pos >= min_length:
+                bounds.append((start_pos, end_pos_exclusive))
+            next_free = end_pos_exclusive
+    
+    return bounds
+
+
+def _encode_pattern(pattern: str) -> Optional[bytes]:
+    """
+    Padroniza um padrão de busca para bytes ASCII maiúsculos.
+    Retorna None para padrões fora do ASCII, que nunca ocorrem numa sequência válida.
+    """
+    try:
+        return pattern.upper().encode('ascii')
+    except UnicodeEncodeError:
+        return None
+
+
+def _low_bit_mask(length: int) -> int:
+    """Inteiro com o bit menos significativo de cada um dos length bytes ligado."""
+    return int.from_bytes(b'\x01' * length, 'big')
+
+
+def _count_differing_bytes(a: int, b: int, mask: int) -> int:
+    """Conta os bytes diferentes entre dois buffers convertidos em inteiros."""
+    # XOR compara todas as bases de uma vez; cada byte não nulo é então
+    # reduzido ao seu bit menos significativo e os bits são contados
+    diff = a ^ b
+    diff |= diff >> 4
+    diff |= diff >> 2
+    diff |= diff >> 1
+    return (diff & mask).bit_count()
 
 
 # --- Classe Principal ---
@@ -30,17 +139,54 @@ class DNASequence:
     complementaridade (complemento reverso), transcrição e análise.
     """
     
-    _COMPLEMENT_MAP = str.maketrans('ATGCN', 'TACGN')
+    # Sem __dict__: reduz a memória por instância em arquivos com muitas sequências
+    __slots__ = ('_data', '_text', 'id', 'description',
+                 '_base_composition', '_gc_count', '_site_cache')
+    
+    _COMPLEMENT_TABLE = bytes.maketrans(b'ATGCN', b'TACGN')
+    _TRANSCRIBE_TABLE = bytes.maketrans(b'T', b'U')
+    _RESTRICTION_SITES = {
+        'EcoRI': 'GAATTC',
+        'BamHI': 'GGATCC',
+        'HindIII': 'AAGCTT',
+        'PstI': 'CTGCAG',
+        'SmaI': 'CCCGGG',
+        'XbaI': 'TCTAGA'
+    }
     
     def __init__(self, sequence: str, seq_id: Optional[str] = None, 
                  description: Optional[str] = None):
         """Inicializa a sequência, validando e padronizando-a."""
-        self._sequence = sequence.upper().strip()
         self.id = seq_id if seq_id is not None else "unnamed"
         self.description = description if description is not None else ""
+        self._reset_caches()
+        
+        # A sequência é armazenada como um buffer contíguo de bytes ASCII;
+        # a versão em str só é materializada quando solicitada.
+        try:
+            raw = sequence.strip().encode('ascii')
+        except UnicodeEncodeError:
+            raise InvalidSequenceError("A sequência contém caracteres não-DNA inválidos.") from None
         
-        if not DNAValidator.is_valid(self._sequence):
+        # Maiúsculas e validação numa única passada, sem o upper() da str
+        normalized = DNAValidator.normalize_bytes(raw)
+        if normalized is None:
             raise InvalidSequenceError("A sequência contém caracteres não-DNA inválidos.")
+        self._data = normalized
+    
+    def _reset_caches(self) -> None:
+        """Inicializa os caches de resultados derivados (a sequência é imutável)."""
+        self._text: Optional[str] = None
+        self._base_composition: Optional[Dict[str, int]] = None
+        self._gc_count: Optional[int] = None
+        self._site_cache: Optional[Dict[str, List[int]]] = None
+    
+    @property
+    def _sequence(self) -> str:
+        """Decodifica (uma única vez) o buffer de bytes para str."""
+        if self._text is None:
+            self._text = self._data.decode('ascii')
+        return self._text
     
     @property
     def sequence(self) -> str:
@@ -48,39 +194,100 @@ class DNASequence:
         return self._sequence
     
     def __len__(self) -> int:
-        return len(self._sequence)
+        return len(self._data)
     
     def __str__(self) -> str:
         return f"DNASequence(id='{self.id}', length={len(self)})"
     
     def __repr__(self) -> str:
-        preview = self._sequence[:50] + "..." if len(self) > 50 else self._sequence
+        # Decodifica só o trecho exibido, sem materializar a sequência inteira
+        preview = self._data[:50].decode('ascii')
+        if len(self) > 50:
+            preview += "..."
         return f"DNASequence(id='{self.id}', seq='{preview}')"
     
     def __getitem__(self, key):
         """Permite fatiar a sequência. Retorna uma nova DNASequence se for um slice."""
-        result = self._sequence[key]
         if isinstance(key, slice):
-            return self._create_slice_sequence(result)
-        return result
+            return self._create_slice_sequence(self._data[key])
+        return chr(self._data[key])
     
     def __eq__(self, other) -> bool:
         """Compara duas sequências de DNA pelo seu conteúdo."""
         if not isinstance(other, DNASequence):
             return NotImplemented
-        return self._sequence == other._sequence
+        return self._data == other._data
+    
+    @classmethod
+    def _unchecked(cls, data: bytes, seq_id: str, description: str = "") -> 'DNASequence':
+        """
+        Cria uma DNASequence a partir de bytes já padronizados e validados,
+        sem upper(), strip() nem validação. Usado por operações cuja saída
+        é válida por construção.
+        """
+        instance = cls.__new__(cls)
+        instance._data = data
+        instance.id = seq_id
+        instance.description = description
+        instance._reset_caches()
+        return instance
+    
+    @classmethod
+    def from_fasta_records(cls, records: List[Tuple[str, str, bytes]]) -> List['DNASequence']:
+        """
+        Cria várias sequências a partir de registros (id, descrição, corpo em bytes).
+
+        Cada corpo é padronizado e validado numa única passada, sem o upper()
+        e a validação separados do construtor.
+        """
+        sequences = []
+        for seq_id, description, body in records:
+            normalized = DNAValidator.normalize_bytes(body)
+            if normalized is None:
+                # Caminho raro: o construtor normal aponta o erro do registro inválido
+                cls(body.decode('ascii', 'replace'), seq_id, description)
+            
+            # Corpos já em maiúsculas (o caso comum) reaproveitam o buffer original
+            if normalized == body:
+                normalized = body
+            sequences.append(cls._unchecked(normalized, seq_id, description))
+        return sequences
     
-    def _create_slice_sequence(self, sub_sequence: str) -> 'DNASequence':
+    def _create_slice_sequence(self, sub_data: bytes) -> 'DNASequence':
         """Método auxiliar para criar um objeto DNASequence a partir de um slice."""
-        new_id = f"{self.id}_slice_{len(sub_sequence)}"
-        return DNASequence(sub_sequence, new_id)
+        # Um slice de dados válidos é válido, exceto quando vazio
+        if not sub_data:
+            raise InvalidSequenceError("A sequência contém caracteres não-DNA inválidos.")
+        new_id = f"{self.id}_slice_{len(sub_data)}"
+        return self._unchecked(sub_data, new_id)
 
     # --- OPERAÇÕES BÁSICAS ---
     
+    def _composition(self) -> Dict[str, int]:
+        """Retorna a composição de bases, calculando-a apenas na primeira chamada."""
+        if self._base_composition is None:
+            data = self._data
+            counted_bases = DNAValidator._VALID_BASES - {'N'}
+            comp = {base: data.count(base.encode('ascii')) for base in counted_bases}
+            # A sequência já foi validada: o que não é A/C/G/T só pode ser N
+            comp['N'] = len(data) - sum(comp.values())
+            self._base_composition = {base: comp[base] for base in sorted(comp)}
+        return self._base_composition
+    
     def get_base_composition(self) -> Dict[str, int]:
         """Calcula a contagem de cada base (A, T, G, C, N) na sequência."""
-        bases = DNAValidator._VALID_BASES
-        return {base: self._sequence.count(base) for base in sorted(list(bases))}
+        # Cópia para que o chamador não altere o cache interno
+        return dict(self._composition())
+    
+    def _count_gc(self) -> int:
+        """Conta G + C, reaproveitando a composição se ela já estiver calculada."""
+        if self._gc_count is None:
+            if self._base_composition is not None:
+                self._gc_count = self._base_composition['G'] + self._base_composition['C']
+            else:
+                # Apenas duas contagens em C, sem calcular a composição completa
+                self._gc_count = self._data.count(b'G') + self._data.count(b'C')
+        return self._gc_count
     
     def gc_content(self) -> float:
         """Calcula o percentual de bases Guanina (G) e Citosina (C)."""
@@ -88,56 +295,92 @@ class DNASequence:
         if total_length == 0:
             return 0.0
         
-        comp = self.get_base_composition()
-        gc_count = comp.get('G', 0) + comp.get('C', 0)
-        return (gc_count / total_length) * 100.0
+        return (self._count_gc() / total_length) * 100.0
     
     # --- COMPLEMENTARIDADE ---
     
     def complement(self) -> 'DNASequence':
         """Retorna a sequência complementar."""
-        complement_seq = self._sequence.translate(self._COMPLEMENT_MAP)
-        return DNASequence(complement_seq, f"{self.id}_complement")
+        complement_data = self._data.translate(self._COMPLEMENT_TABLE)
+        return self._unchecked(complement_data, f"{self.id}_complement")
     
     def reverse(self) -> 'DNASequence':
         """Retorna a sequência invertida (não o complemento)."""
-        return DNASequence(
-            self._sequence[::-1],
-            f"{self.id}_reverse"
-        )
+        return self._unchecked(self._data[::-1], f"{self.id}_reverse")
     
     def reverse_complement(self) -> 'DNASequence':
         """Retorna o complemento reverso da sequência."""
-        rev_comp_seq = self.complement().sequence[::-1]
-        return DNASequence(rev_comp_seq, f"{self.id}_revcomp")
+        # Inverte e complementa direto no buffer, sem objetos intermediários
+        rev_comp_data = self._data[::-1].translate(self._COMPLEMENT_TABLE)
+        return self._unchecked(rev_comp_data, f"{self.id}_revcomp")
+    
+    # --- COMPARAÇÃO ---
+    
+    def _to_int(self) -> int:
+        """Retorna o buffer como um inteiro (um byte por base)."""
+        return int.from_bytes(self._data, 'big')
+    
+    def hamming_distance(self, other: 'DNASequence') -> int:
+        """Conta as posições em que duas sequências de mesmo comprimento diferem."""
+        if len(self) != len(other):
+            raise ValueError("As sequências precisam ter o mesmo comprimento.")
+        return _count_differing_bytes(self._to_int(), other._to_int(),
+                                      _low_bit_mask(len(self)))
+    
+    @staticmethod
+    def pairwise_hamming(sequences: List['DNASequence']) -> List[List[int]]:
+        """Retorna a matriz de distâncias de Hamming entre todas as sequências."""
+        size = len(sequences)
+        # Conversões e máscaras valem só durante esta chamada, sem ficar em cache
+        as_ints = [dna._to_int() for dna in sequences]
+        masks: Dict[int, int] = {}
+        
+        matrix = [[0] * size for _ in range(size)]
+        for i in range(size):
+            length = len(sequences[i])
+            if length not in masks:
+                masks[length] = _low_bit_mask(length)
+            for j in range(i + 1, size):
+                if len(sequences[j]) != length:
+                    raise ValueError("As sequências precisam ter o mesmo comprimento.")
+                matrix[i][j] = matrix[j][i] = _count_differing_bytes(
+                    as_ints[i], as_ints[j], masks[length])
+        return matrix
     
     # --- TRANSCRIÇÃO ---
     
     def transcribe(self) -> str:
         """Transcreve a sequência de DNA para RNA (substituindo T por U)."""
-        return self._sequence.replace('T', 'U')
+        return self.transcribe_bytes().decode('ascii')
+    
+    def transcribe_bytes(self) -> bytes:
+        """Versão de transcribe que retorna bytes ASCII, sem decodificar para str."""
+        return self._data.translate(self._TRANSCRIBE_TABLE)
     
     # --- BUSCA DE PADRÕES ---
     
-    def find_all_occurrences(self, pattern: str) -> List[int]:
-        """Encontra todas as posições iniciais (índices) de um padrão."""
-        target_pattern = pattern.upper()
-        positions = []
-        start_index = 0
+    def _positions(self, target: bytes, step: int = 1) -> List[int]:
+        """Retorna as posições de target no buffer, avançando step após cada achado."""
+        return _find_positions(self._data, target, step)
+    
+    def find_all_occurrences(self, pattern: str, overlap: bool = True) -> List[int]:
+        """
+        Encontra todas as posições iniciais (índices) de um padrão.
+        Com overlap=False, a busca continua após o fim de cada ocorrência.
+        """
+        target_pattern = _encode_pattern(pattern)
+        if target_pattern is None:
+            return []
         
-        while True:
-            position = self._sequence.find(target_pattern, start_index)
-            if position == -1:
-                break
-            
-            positions.append(position)
-            start_index = position + 1
-            
-        return positions
+        step = max(len(target_pattern), 1) if not overlap else 1
+        return self._positions(target_pattern, step)
     
     def count_pattern_occurrences(self, pattern: str) -> int:
         """Conta o número de ocorrências exatas de um padrão."""
-        return self._sequence.count(pattern.upper())
+        target_pattern = _encode_pattern(pattern)
+        if target_pattern is None:
+            return 0
+        return self._data.count(target_pattern)
     
     # --- ANÁLISE DE ORFs ---
     
@@ -147,38 +390,9 @@ class DNASequence:
         Retorna uma lista de tuplas: (start_index, end_index_exclusive, orf_sequence).
         """
         orfs = []
-        START_CODON = 'ATG'
-        STOP_CODONS = {'TAA', 'TAG', 'TGA'}
-        
-        for frame_shift in range(3):
-            i = frame_shift
-            while i < len(self) - 2:
-                codon = self._sequence[i:i+3]
-                
-                if codon == START_CODON:
-                    start_pos = i
-                    j = i + 3
-                    
-                    while j < len(self) - 2:
-                        stop_codon = self._sequence[j:j+3]
-                        
-                        if stop_codon in STOP_CODONS:
-                            end_pos_exclusive = j + 3
-                            orf_length = end_pos_exclusive - start_pos
-                            
-                            if orf_length >= min_length_bp:
-                                orf_seq = self._sequence[start_pos:end_pos_exclusive]
-                                orfs.append((start_pos, end_pos_exclusive, orf_seq))
-                            
-                            i = end_pos_exclusive
-                            break
-                        
-                        j += 3
-                    else:
-                        i += 3
-                else:
-                    i += 3
-                    
+        for start_pos, end_pos_exclusive in _find_orf_bounds(self._data, min_length_bp):
+            orf_seq = self._data[start_pos:end_pos_exclusive].decode('ascii')
+            orfs.append((start_pos, end_pos_exclusive, orf_seq))
         return orfs
 
     # --- ANÁLISES AVANÇADAS ---
@@ -187,9 +401,9 @@ class DNASequence:
         """
         Calcula a temperatura de desnaturação (Tm) da sequência.
         """
-        comp = self.get_base_composition()
-        gc_count = comp.get('G', 0) + comp.get('C', 0)
-        at_count = comp.get('A', 0) + comp.get('T', 0)
+        comp = self._composition()
+        gc_count = comp['G'] + comp['C']
+        at_count = comp['A'] + comp['T']
         
         total_length = len(self)
         if total_length == 0:
@@ -199,29 +413,71 @@ class DNASequence:
             # Regra de Wallace (rápida)
             return 4.0 * gc_count + 2.0 * at_count
         else:
-            # Fórmula empírica para sequências mais longas
-            gc_fraction = self.gc_content() / 100.0
+            # Fórmula empírica para sequências mais longas, reaproveitando a composição
+            gc_fraction = gc_count / total_length
             return 64.9 + 41.0 * (gc_fraction - (16.4 / total_length))
     
     def find_restriction_sites(self, enzyme: str) -> List[int]:
         """
         Encontra as posições dos sítios de restrição de uma enzima comum.
         """
-        RESTRICTION_SITES = {
-            'EcoRI': 'GAATTC',
-            'BamHI': 'GGATCC',
-            'HindIII': 'AAGCTT',
-            'PstI': 'CTGCAG',
-            'SmaI': 'CCCGGG',
-            'XbaI': 'TCTAGA'
-        }
-        
-        recognition_sequence = RESTRICTION_SITES.get(enzyme)
+        recognition_sequence = self._RESTRICTION_SITES.get(enzyme)
         
         if recognition_sequence is None:
             return []
         
-        return self.find_all_occurrences(recognition_sequence)
+        return list(self._cached_sites(enzyme, recognition_sequence.encode('ascii')))
+    
+    def _cached_sites(self, enzyme: str, site: bytes) -> List[int]:
+        """
+        Retorna as posições do sítio de uma enzima, buscando-as só na primeira vez.
+        A lista devolvida é o próprio cache: quem a expõe deve copiá-la.
+        """
+        if self._site_cache is None:
+            self._site_cache = {}
+        if enzyme not in self._site_cache:
+            # Os sítios da tabela não se sobrepõem a si mesmos
+            self._site_cache[enzyme] = self._positions(site, len(site))
+        return self._site_cache[enzyme]
+    
+    def find_restriction_sites_multi(self, enzymes: List[str]) -> Dict[str, List[int]]:
+        """
+        Encontra os sítios de restrição de várias enzimas de uma só vez.
+        Retorna um dicionário {enzima: posições}; enzimas desconhecidas
+        recebem uma lista vazia.
+        """
+        return RestrictionScanner(enzymes).scan(self)
+
+
+class RestrictionScanner:
+    """
+    Busca um painel fixo de enzimas de restrição em várias sequências.
+
+    O painel é resolvido e codificado uma única vez, amortizando a preparação
+    quando muitas sequências são varridas (ex.: todas as de um arquivo FASTA).
+    """
+    
+    def __init__(self, enzymes: Optional[List[str]] = None):
+        """Prepara o painel; sem argumentos, usa todas as enzimas conhecidas."""
+        if enzymes is None:
+            enzymes = list(DNASequence._RESTRICTION_SITES)
+        self.enzymes = list(enzymes)
+        self._sites = [
+            (enzyme, DNASequence._RESTRICTION_SITES[enzyme].encode('ascii'))
+            for enzyme in self.enzymes
+            if enzyme in DNASequence._RESTRICTION_SITES
+        ]
+    
+    def scan(self, dna: DNASequence) -> Dict[str, List[int]]:
+        """
+        Retorna um dicionário {enzima: posições} para a sequência informada;
+        enzimas desconhecidas recebem uma lista vazia.
+        """
+        results: Dict[str, List[int]] = {enzyme: [] for enzyme in self.enzymes}
+        for enzyme, site in self._sites:
+            # Compartilha o cache por sequência com find_restriction_sites
+            results[enzyme] = list(dna._cached_sites(enzyme, site))
+        return results
 
 
 if __name__ == "__main__":
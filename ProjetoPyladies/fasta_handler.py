@@ -1,4 +1,6 @@
-from typing import List
+import mmap
+import os
+from typing import List, Tuple
 from pathlib import Path
 
 
@@ -9,43 +11,88 @@ class FileFormatError(Exception):
 class FastaHandler:
     """Manipulação de arquivos FASTA"""
     
+    # Bytes ignorados no corpo das sequências (quebras de linha e espaços)
+    _WHITESPACE = b' \t\r\n\x0b\x0c'
+    # Espaços permitidos antes do '>' de um cabeçalho
+    _INLINE_SPACES = b' \t\x0b\x0c'
+    
     @staticmethod
     def read(filepath: str, seq_class):
         """Lê arquivo FASTA e retorna lista de sequências."""
         if not Path(filepath).exists():
             raise FileFormatError(f"Arquivo não encontrado: {filepath}")
         
+        records = FastaHandler._parse_records(filepath)
+        
+        # Classes que sabem construir em lote (como DNASequence) validam todos
+        # os registros de uma vez
+        batch_builder = getattr(seq_class, 'from_fasta_records', None)
+        if batch_builder is not None:
+            return batch_builder(records)
+        
         sequences = []
-        current_id = None
-        current_desc = None
-        current_seq_parts = []
+        for seq_id, description, body in records:
+            # Bytes não-ASCII viram U+FFFD e são rejeitados pela validação da classe
+            sequences.append(seq_class(body.decode('ascii', 'replace'), seq_id, description))
         
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+        return sequences
+    
+    @staticmethod
+    def _header_positions(mm: mmap.mmap) -> List[Tuple[int, int]]:
+        """
+        Retorna (início da linha, posição do '>') de cada cabeçalho do arquivo.
+
+        Um '>' é cabeçalho se antes dele, na mesma linha, só houver espaços.
+        As linhas podem terminar em \n, \r\n ou só \r, como na leitura em modo texto.
+        """
+        positions = []
+        gt = mm.find(b'>')
+        while gt != -1:
+            line_start = gt
+            while line_start > 0 and mm[line_start - 1] in FastaHandler._INLINE_SPACES:
+                line_start -= 1
+            if line_start == 0 or mm[line_start - 1] in b'\r\n':
+                positions.append((line_start, gt))
+            gt = mm.find(b'>', gt + 1)
+        return positions
+    
+    @staticmethod
+    def _parse_records(filepath: str) -> List[Tuple[str, str, bytes]]:
+        """
+        Separa o arquivo em registros (id, descrição, corpo) sem iterar linha a linha.
+
+        O arquivo é mapeado em memória e os cabeçalhos são localizados buscando
+        '>' diretamente no mapeamento; as quebras de linha do corpo são
+        removidas com uma chamada a bytes.translate por registro.
+        """
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                records = []
+                headers = FastaHandler._header_positions(mm)
                 
-                if line.startswith('>'):
-                    # Se houver uma sequência anterior, processe-a antes de iniciar a nova
-                    if current_id:
-                        seq = ''.join(current_seq_parts)
-                        sequences.append(seq_class(seq, current_id, current_desc))
+                # Texto antes do primeiro cabeçalho é ignorado
+                for i, (_, gt) in enumerate(headers):
+                    end = headers[i + 1][0] if i + 1 < len(headers) else len(mm)
                     
-                    # Inicia nova sequência
-                    header = line[1:].split(maxsplit=1)
-                    current_id = header[0]
-                    current_desc = header[1] if len(header) > 1 else ""
-                    current_seq_parts = []
-                else:
-                    current_seq_parts.append(line)
-            
-            # Processa a última sequência no arquivo
-            if current_id:
-                seq = ''.join(current_seq_parts)
-                sequences.append(seq_class(seq, current_id, current_desc))
+                    # O cabeçalho vai até a primeira quebra de linha (\n ou \r)
+                    header_end = end
+                    for line_break in (b'\n', b'\r'):
+                        position = mm.find(line_break, gt, header_end)
+                        if position != -1:
+                            header_end = position
+                    
+                    fields = mm[gt + 1:header_end].decode('utf-8', 'replace').strip().split(maxsplit=1)
+                    if not fields:
+                        raise FileFormatError(f"Cabeçalho FASTA sem identificador em: {filepath}")
+                    
+                    description = fields[1] if len(fields) > 1 else ""
+                    body = mm[header_end:end].translate(None, FastaHandler._WHITESPACE)
+                    records.append((fields[0], description, body))
         
-        return sequences
+        return records
     
     @staticmethod
     def write(sequences: List, filepath: str, width: int = 80):
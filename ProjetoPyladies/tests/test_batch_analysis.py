@@ -0,0 +1,30 @@
+import unittest
+from dna_sequence import DNASequence
+from batch_analysis import analyze_sequences
+
+
+class TestBatchAnalysis(unittest.TestCase):
+    
+    def setUp(self):
+        self.sequences = [
+            DNASequence("ATGAAATAGGAATTC", seq_id="s1"),
+            DNASequence("GGATCCGGCC", seq_id="s2"),
+            DNASequence("ATGCATGC", seq_id="s3"),
+        ]
+    
+    def test_serial(self):
+        results = analyze_sequences(self.sequences, min_orf_length=9,
+                                    enzymes=["EcoRI", "BamHI"], max_workers=1)
+        self.assertEqual([r['id'] for r in results], ["s1", "s2", "s3"])
+        self.assertEqual(results[0]['orfs'], [(0, 9, "ATGAAATAG")])
+        self.assertEqual(results[0]['restriction_sites'], {"EcoRI": [9], "BamHI": []})
+        self.assertAlmostEqual(results[1]['gc_content'], 80.0)
+    
+    def test_parallel_matches_serial(self):
+        serial = analyze_sequences(self.sequences, max_workers=1)
+        parallel = analyze_sequences(self.sequences, max_workers=2)
+        self.assertEqual(parallel, serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 import unittest
-from dna_sequence import DNASequence, InvalidSequenceError
+from unittest import mock
+
+import dna_sequence
+from dna_sequence import DNASequence, DNAValidator, InvalidSequenceError, RestrictionScanner
 
 
 class TestDNASequence(unittest.TestCase):
@@ -16,11 +19,43 @@ class TestDNASequence(unittest.TestCase):
         # Deve levantar exceção para bases inválidas
         with self.assertRaises(InvalidSequenceError):
             DNASequence("ATGCUX")
-    
+        with self.assertRaises(InvalidSequenceError):
+            DNASequence("ATGÇ")
+
+    def test_validator(self):
+        self.assertTrue(DNAValidator.is_valid("acgtnACGTN"))
+        self.assertFalse(DNAValidator.is_valid(""))
+        self.assertFalse(DNAValidator.is_valid("ACGU"))
+        self.assertFalse(DNAValidator.is_valid("ACGé"))
+
+    def test_normalize_bytes(self):
+        self.assertEqual(DNAValidator.normalize_bytes(b"acgtnACGTN"), b"ACGTNACGTN")
+        self.assertIsNone(DNAValidator.normalize_bytes(b""))
+        self.assertIsNone(DNAValidator.normalize_bytes(b"ACG\x00"))
+        self.assertIsNone(DNAValidator.normalize_bytes(b"ACGU"))
+
+    def test_lowercase_is_normalized(self):
+        self.assertEqual(DNASequence("  atgcn ").sequence, "ATGCN")
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(self.seq, "__dict__"))
+        self.assertFalse(hasattr(self.seq.reverse_complement(), "__dict__"))
+
+    def test_repr(self):
+        self.assertEqual(repr(self.seq), "DNASequence(id='test1', seq='ATGCATGC')")
+        long_seq = DNASequence("ACGT" * 20, seq_id="longa")
+        self.assertEqual(repr(long_seq), f"DNASequence(id='longa', seq='{'ACGT' * 12}AC...')")
+
     def test_gc_content(self):
         self.assertAlmostEqual(self.seq.gc_content(), 50.0)
         self.assertEqual(DNASequence("AATT").gc_content(), 0.0)
     
+    def test_melting_temp(self):
+        self.assertAlmostEqual(self.seq.calculate_melting_temp(), 24.0)
+        long_seq = DNASequence("ATGCATGCTAGCTAGCATGCG")
+        expected = 64.9 + 41.0 * (long_seq.gc_content() / 100.0 - 16.4 / 21)
+        self.assertAlmostEqual(long_seq.calculate_melting_temp(), expected)
+
     def test_complement(self):
         comp = self.seq.complement()
         self.assertEqual(comp.sequence, "TACGTACG")
@@ -28,15 +63,57 @@ class TestDNASequence(unittest.TestCase):
     def test_reverse_complement(self):
         rc = self.seq.reverse_complement()
         self.assertEqual(rc.sequence, "GCATGCAT")
+        self.assertEqual(rc.id, "test1_revcomp")
+        self.assertEqual(DNASequence("AACGN").reverse_complement().sequence, "NCGTT")
+
+    def test_reverse(self):
+        self.assertEqual(DNASequence("AACGN").reverse().sequence, "NGCAA")
     
+    def test_hamming_distance(self):
+        self.assertEqual(self.seq.hamming_distance(DNASequence("ATGCATGC")), 0)
+        self.assertEqual(self.seq.hamming_distance(DNASequence("ATGNATGA")), 2)
+        with self.assertRaises(ValueError):
+            self.seq.hamming_distance(DNASequence("ATG"))
+
+    def test_pairwise_hamming(self):
+        seqs = [DNASequence("AAAA"), DNASequence("AAAT"), DNASequence("TTTT")]
+        self.assertEqual(DNASequence.pairwise_hamming(seqs), [[0, 1, 4], [1, 0, 3], [4, 3, 0]])
+        with self.assertRaises(ValueError):
+            DNASequence.pairwise_hamming([DNASequence("AAAA"), DNASequence("AAA")])
+
     def test_transcribe(self):
         rna = self.seq.transcribe()
         self.assertEqual(rna, "AUGCAUGC")
+        self.assertEqual(self.seq.transcribe_bytes(), b"AUGCAUGC")
     
     def test_find_all_occurrences(self):
         seq = DNASequence("ATGATGATG")
         positions = seq.find_all_occurrences("ATG")
         self.assertEqual(positions, [0, 3, 6])
+
+    def test_find_all_occurrences_overlap(self):
+        seq = DNASequence("AAAA")
+        self.assertEqual(seq.find_all_occurrences("aa"), [0, 1, 2])
+        self.assertEqual(seq.find_all_occurrences("AA", overlap=False), [0, 2])
+        self.assertEqual(seq.find_all_occurrences("AÇ"), [])
+
+    def test_count_pattern_occurrences(self):
+        seq = DNASequence("ATGATGCATGATG")
+        self.assertEqual(seq.count_pattern_occurrences("atg"), 4)
+        self.assertEqual(seq.count_pattern_occurrences("AÇ"), 0)
+
+    def test_find_restriction_sites(self):
+        seq = DNASequence("ATGAATTCGGCCATGAATTC")
+        self.assertEqual(seq.find_restriction_sites("EcoRI"), [2, 14])
+        self.assertEqual(seq.find_restriction_sites("Desconhecida"), [])
+        # O resultado em cache não pode ser alterado pelo chamador
+        seq.find_restriction_sites("EcoRI").append(99)
+        self.assertEqual(seq.find_restriction_sites("EcoRI"), [2, 14])
+
+    def test_find_restriction_sites_multi(self):
+        seq = DNASequence("GAATTCGGATCCAAGAATTC")
+        sites = seq.find_restriction_sites_multi(["EcoRI", "BamHI", "SmaI", "Desconhecida"])
+        self.assertEqual(sites, {"EcoRI": [0, 14], "BamHI": [6], "SmaI": [], "Desconhecida": []})
     
     def test_base_composition(self):
         comp = self.seq.get_base_composition()
@@ -45,12 +122,59 @@ class TestDNASequence(unittest.TestCase):
         self.assertEqual(comp['G'], 2)
         self.assertEqual(comp['C'], 2)
         self.assertEqual(comp['N'], 0)
-    
+
+    def test_base_composition_is_cached_copy(self):
+        seq = DNASequence("ACGTNN")
+        comp = seq.get_base_composition()
+        self.assertEqual(comp['N'], 2)
+        comp['A'] = 100
+        self.assertEqual(seq.get_base_composition()['A'], 1)
+
+    def test_find_orfs(self):
+        seq = DNASequence("CCATGAAATAGGATGCCCTGAATG")
+        self.assertEqual(seq.find_orfs(min_length_bp=9),
+                         [(12, 21, "ATGCCCTGA"), (2, 11, "ATGAAATAG")])
+        self.assertEqual(seq.find_orfs(min_length_bp=10), [])
+
+    def test_restriction_scanner(self):
+        scanner = RestrictionScanner(["EcoRI", "XbaI"])
+        self.assertEqual(scanner.scan(DNASequence("TCTAGAATTC")), {"EcoRI": [4], "XbaI": [0]})
+        self.assertEqual(scanner.scan(DNASequence("AAAA")), {"EcoRI": [], "XbaI": []})
+        self.assertEqual(len(RestrictionScanner().scan(self.seq)), 6)
+
+    def test_restriction_scanner_shares_site_cache(self):
+        seq = DNASequence("GAATTCGGATCC")
+        with mock.patch.object(dna_sequence, "_find_positions",
+                               wraps=dna_sequence._find_positions) as find:
+            sites = RestrictionScanner(["EcoRI"]).scan(seq)
+            # Resultados devolvidos são cópias do cache
+            sites["EcoRI"].append(99)
+            self.assertEqual(seq.find_restriction_sites("EcoRI"), [0])
+            seq.find_restriction_sites("BamHI")
+            self.assertEqual(RestrictionScanner(["BamHI", "EcoRI"]).scan(seq),
+                             {"BamHI": [6], "EcoRI": [0]})
+            self.assertEqual(seq.find_restriction_sites_multi(["EcoRI", "BamHI"]),
+                             {"EcoRI": [0], "BamHI": [6]})
+        # Cada sítio é procurado uma única vez, seja qual for o ponto de entrada
+        self.assertEqual(find.call_count, 2)
+
+    def test_from_fasta_records(self):
+        seqs = DNASequence.from_fasta_records([("a", "desc", b"acgt"), ("b", "", b"NNGG")])
+        self.assertEqual([s.sequence for s in seqs], ["ACGT", "NNGG"])
+        self.assertEqual((seqs[0].id, seqs[0].description), ("a", "desc"))
+        with self.assertRaises(InvalidSequenceError):
+            DNASequence.from_fasta_records([("a", "", b"ACGT"), ("b", "", b"ACXU")])
+        with self.assertRaises(InvalidSequenceError):
+            DNASequence.from_fasta_records([("a", "", b"")])
+
     def test_slicing(self):
         sub = self.seq[0:4]
         self.assertTrue(isinstance(sub, DNASequence))
         self.assertEqual(sub.sequence, "ATGC")
         self.assertEqual(sub.id, "test1_slice_4")
+        self.assertEqual(self.seq[-1], "C")
+        with self.assertRaises(InvalidSequenceError):
+            self.seq[4:4]
 
 
 if __name__ == '__main__':
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from dna_sequence import DNASequence
+from fasta_handler import FastaHandler, FileFormatError
+
+
+class TestFastaHandler(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "seqs.fasta")
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _read(self, content: bytes):
+        with open(self.path, 'wb') as f:
+            f.write(content)
+        return [(s.id, s.description, s.sequence)
+                for s in FastaHandler.read(self.path, DNASequence)]
+    
+    def test_read_multiple_records(self):
+        records = self._read(b">s1 desc here\nACGT\nacgt\n>s2\nNNGG\n")
+        self.assertEqual(records, [("s1", "desc here", "ACGTACGT"), ("s2", "", "NNGG")])
+    
+    def test_read_crlf(self):
+        records = self._read(b">s1 desc here\r\nACGT\r\nTT\r\n>s2\r\nGG")
+        self.assertEqual(records, [("s1", "desc here", "ACGTTT"), ("s2", "", "GG")])
+    
+    def test_read_cr_only(self):
+        records = self._read(b">s1 desc\rAC\rGT\r>s2\rGG\r")
+        self.assertEqual(records, [("s1", "desc", "ACGT"), ("s2", "", "GG")])
+    
+    def test_header_with_leading_whitespace(self):
+        records = self._read(b">s1\nAC\n  >s2 x\nGG\n\t>s3\nTT\n")
+        self.assertEqual(records, [("s1", "", "AC"), ("s2", "x", "GG"), ("s3", "", "TT")])
+    
+    def test_gt_inside_header_is_not_a_record(self):
+        records = self._read(b">s1 a > b\nAC\n")
+        self.assertEqual(records, [("s1", "a > b", "AC")])
+    
+    def test_read_blank_lines(self):
+        records = self._read(b"\n>s1\n\nACGT\n\n\nGG\n\n>s2 x\nTT\n\n")
+        self.assertEqual(records, [("s1", "", "ACGTGG"), ("s2", "x", "TT")])
+    
+    def test_text_before_first_header_is_ignored(self):
+        records = self._read(b"comentario\nsem cabecalho\n>s1\nACGT\n")
+        self.assertEqual(records, [("s1", "", "ACGT")])
+    
+    def test_empty_header_raises(self):
+        with self.assertRaises(FileFormatError):
+            self._read(b">s1\nAC\n>\nGG\n>s3\nTT\n")
+        with self.assertRaises(FileFormatError):
+            self._read(b">s1\nAC\n>   \nGG\n")
+    
+    def test_empty_file(self):
+        self.assertEqual(self._read(b""), [])
+    
+    def test_missing_file(self):
+        with self.assertRaises(FileFormatError):
+            FastaHandler.read(self.path, DNASequence)
+    
+    def test_write_read_roundtrip(self):
+        seqs = [DNASequence("ACGT" * 30, "s1", "primeira"), DNASequence("GGCC", "s2")]
+        FastaHandler.write(seqs, self.path, width=50)
+        result = FastaHandler.read(self.path, DNASequence)
+        self.assertEqual([(s.id, s.description, s.sequence) for s in result],
+                         [(s.id, s.description, s.sequence) for s in seqs])
+
+
+if __name__ == '__main__':
+    unittest.main()